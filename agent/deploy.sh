@@ -20,6 +20,9 @@ export SERVICE_NAME="website-agent-service"
 # Set an application name (optional)
 export APP_NAME="website-agent-app"
 
+# Set the server log level (debug, info, warning, error, critical)
+export LOG_LEVEL="${LOG_LEVEL:-info}"
+
 # -----------------------------
 # Deploy to Google Cloud Run
 # -----------------------------
@@ -30,6 +33,7 @@ echo "Region: $GOOGLE_CLOUD_LOCATION"
 echo "Service: $SERVICE_NAME"
 echo "App Name: $APP_NAME"
 echo "Agent Path: $AGENT_PATH"
+echo "Log Level: $LOG_LEVEL"
 
 adk deploy cloud_run \
   --project="$GOOGLE_CLOUD_PROJECT" \
@@ -38,6 +42,7 @@ adk deploy cloud_run \
   --app_name="$APP_NAME" \
   --with_ui \
   --trace_to_cloud \
+  --log_level="$LOG_LEVEL" \
   "$AGENT_PATH"
 
 echo "✅ Deployment complete."
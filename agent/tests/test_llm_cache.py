@@ -0,0 +1,56 @@
+"""Unit tests for semantic cache admission."""
+
+import pytest
+from google.adk.models import LlmRequest
+from google.genai import types
+from website_agent_service.llm_cache import SemanticCache
+
+
+def _tool_turn(name: str, response: dict) -> LlmRequest:
+    return LlmRequest(
+        contents=[
+            types.Content(role="user", parts=[types.Part(text="What do you offer?")]),
+            types.Content(
+                role="model",
+                parts=[types.Part(function_call=types.FunctionCall(name=name, args={}))],
+            ),
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part(
+                        function_response=types.FunctionResponse(name=name, response=response)
+                    )
+                ],
+            ),
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_successful_lookup_is_cacheable():
+    request = _tool_turn(
+        "get_website_navigation",
+        {"status": "success", "navigation": "https://example.com/pricing"},
+    )
+    assert SemanticCache._turn_is_cacheable(request)
+
+
+@pytest.mark.unit
+def test_failed_lookup_is_not_cacheable():
+    request = _tool_turn(
+        "get_website_services",
+        {"status": "error", "message": "Service request timed out"},
+    )
+    assert not SemanticCache._turn_is_cacheable(request)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("failed", ["services", "navigation"])
+def test_composite_tool_with_failed_part_is_not_cacheable(failed):
+    response = {
+        "services": {"services": [{"id": "1", "name": "Web Development"}]},
+        "navigation": {"status": "success", "navigation": "https://example.com/pricing"},
+    }
+    response[failed] = {"status": "error", "message": "Request timed out"}
+    request = _tool_turn("get_services_and_navigation", response)
+    assert not SemanticCache._turn_is_cacheable(request)
@@ -4,44 +4,60 @@ import logging
 import warnings
 from google.adk import Agent
 from google.genai import types
-from .config import Config
+from .config import get_config
+from .context_cache import ContextCache
 from .prompts import GLOBAL_INSTRUCTION, INSTRUCTION
 from .tools import (
     get_website_services,
-    get_website_navigation
+    get_website_navigation,
+    get_services_and_navigation
 )
 
 warnings.filterwarnings("ignore", category=UserWarning, module=".*pydantic.*")
 
-configs = Config()
+configs = get_config()
 
 # configure logging __name__
 logger = logging.getLogger(__name__)
 
-safety_settings = [
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-        threshold=types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-    ),
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-        threshold=types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-    ),
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-        threshold=types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-    ),
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-        threshold=types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-    ),
-]
-
-# Safety settings for the agent
-generate_content_config = types.GenerateContentConfig(
-   safety_settings=safety_settings,
+_SAFETY_THRESHOLDS = (
+    (types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT, types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE),
+    (types.HarmCategory.HARM_CATEGORY_HARASSMENT, types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE),
+    (types.HarmCategory.HARM_CATEGORY_HATE_SPEECH, types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE),
+    (types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT, types.HarmBlockThreshold.BLOCK_LOW_AND_ABOVE),
 )
 
+SAFETY_SETTINGS = tuple(
+    types.SafetySetting(category=category, threshold=threshold)
+    for category, threshold in _SAFETY_THRESHOLDS
+)
+
+# Safety settings for the agent, built once and shared by every request
+GENERATE_CONTENT_CONFIG = types.GenerateContentConfig(
+   safety_settings=SAFETY_SETTINGS,
+   temperature=configs.agent_settings.temperature,
+)
+
+# The semantic cache runs first so a hit skips the rest of the request
+before_model_callbacks = []
+after_model_callbacks = []
+if configs.semantic_cache_enabled:
+    # Imported here so numpy is only loaded when the cache is in use
+    from .llm_cache import SemanticCache
+
+    # Replay answers to near-identical questions without calling the model
+    semantic_cache = SemanticCache(
+        threshold=configs.semantic_cache_threshold,
+        max_entries=configs.semantic_cache_max_entries,
+        embedding_model=configs.semantic_cache_embedding_model,
+    )
+    before_model_callbacks.append(semantic_cache.before_model_callback)
+    after_model_callbacks.append(semantic_cache.after_model_callback)
+if configs.context_cache_enabled:
+    # Serve the static instruction and tool declarations from Gemini's context cache
+    context_cache = ContextCache(ttl_seconds=configs.context_cache_ttl)
+    before_model_callbacks.append(context_cache.before_model_callback)
+
 
 root_agent = Agent(
     model=configs.agent_settings.model,
@@ -50,9 +66,12 @@ root_agent = Agent(
     name=configs.agent_settings.name,
     tools=[
          get_website_services,
-         get_website_navigation
+         get_website_navigation,
+         get_services_and_navigation
     ],
-    generate_content_config=generate_content_config,
+    generate_content_config=GENERATE_CONTENT_CONFIG,
+    before_model_callback=before_model_callbacks or None,
+    after_model_callback=after_model_callbacks or None,
 )
 
 
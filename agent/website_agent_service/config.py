@@ -2,11 +2,11 @@
 
 import os
 import logging
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BaseModel, Field
 
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +15,7 @@ class AgentModel(BaseModel):
 
     name: str = Field(default="web_agent_service_agent")
     model: str = Field(default="gemini-2.5-flash")
+    temperature: float | None = Field(default=None)
 
 
 class Config(BaseSettings):
@@ -33,11 +34,19 @@ class Config(BaseSettings):
     GOOGLE_GENAI_USE_VERTEXAI: str = Field(default="1")
     GOOGLE_API_KEY: str | None = Field(default="")
     WEBSITE_API_URL: str | None = Field(default="")
-    
-    @property
-    def CLOUD_PROJECT(self):
-        return self.GOOGLE_CLOUD_PROJECT
-    
-    @property 
-    def CLOUD_LOCATION(self):
-        return self.GOOGLE_CLOUD_LOCATION
+    services_cache_ttl: int = Field(default=60)
+    navigation_cache_ttl: int = Field(default=300)
+    # Off by default: the current instruction and tool declarations are far
+    # below Gemini's minimum cacheable size, so cache creation would only fail
+    context_cache_enabled: bool = Field(default=False)
+    context_cache_ttl: int = Field(default=3600)
+    semantic_cache_enabled: bool = Field(default=False)
+    semantic_cache_threshold: float = Field(default=0.9)
+    semantic_cache_max_entries: int = Field(default=512)
+    semantic_cache_embedding_model: str = Field(default="text-embedding-004")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Returns the process-wide configuration, loading it on first use."""
+    return Config()
@@ -0,0 +1,93 @@
+"""Gemini context caching for the static part of every agent request."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+from google import genai
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+
+class ContextCache:
+    """Serves the agent's instructions and tool declarations from a cached-content handle.
+
+    Gemini rejects requests that set `cached_content` together with
+    `system_instruction` or `tools`, so the cache is built from the exact
+    instruction and tools ADK assembles for the request, and both are then
+    stripped from the request in favour of the cached handle. The handle is
+    recreated shortly before its TTL expires. If the cache cannot be created
+    (e.g. the prompt is below the model's minimum cacheable size), requests
+    are sent uncached and creation is retried after another TTL.
+    """
+
+    def __init__(self, ttl_seconds: int = 3600, refresh_margin_seconds: int = 300):
+        self._ttl_seconds = ttl_seconds
+        self._refresh_margin_seconds = min(refresh_margin_seconds, ttl_seconds // 2)
+        self._client: Optional[genai.Client] = None
+        self._lock = asyncio.Lock()
+        self._key: Optional[tuple] = None
+        self._name: Optional[str] = None
+        self._refresh_at = 0.0
+
+    @staticmethod
+    def _request_key(llm_request: LlmRequest) -> tuple:
+        config = llm_request.config
+        return (
+            llm_request.model,
+            repr(config.system_instruction),
+            repr(config.tools),
+            repr(config.tool_config),
+        )
+
+    async def _create(self, llm_request: LlmRequest) -> Optional[str]:
+        config = llm_request.config
+        try:
+            if self._client is None:
+                # Credential discovery can block on the metadata server
+                self._client = await asyncio.to_thread(genai.Client)
+            cached_content = await self._client.aio.caches.create(
+                model=llm_request.model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=config.system_instruction,
+                    tools=config.tools,
+                    tool_config=config.tool_config,
+                    ttl=f"{self._ttl_seconds}s",
+                ),
+            )
+        except Exception as e:
+            logger.warning("Context cache unavailable, sending prompts uncached: %s", e)
+            return None
+        logger.info("Created context cache: %s", cached_content.name)
+        return cached_content.name
+
+    async def _get_cache_name(self, llm_request: LlmRequest) -> Optional[str]:
+        key = self._request_key(llm_request)
+        async with self._lock:
+            if key != self._key or time.monotonic() >= self._refresh_at:
+                self._key = key
+                self._name = await self._create(llm_request)
+                expires_in = self._ttl_seconds
+                if self._name:
+                    expires_in -= self._refresh_margin_seconds
+                self._refresh_at = time.monotonic() + expires_in
+            return self._name
+
+    async def before_model_callback(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Swaps the inline instruction and tools for the cached-content handle."""
+        config = llm_request.config
+        if config is None or config.cached_content or not config.system_instruction:
+            return None
+
+        name = await self._get_cache_name(llm_request)
+        if name:
+            config.cached_content = name
+            config.system_instruction = None
+            config.tools = None
+            config.tool_config = None
+        return None
@@ -0,0 +1,175 @@
+"""Semantic response cache for repeated user questions."""
+
+import asyncio
+import logging
+from typing import Optional
+import numpy as np
+from cachetools import TTLCache
+from google import genai
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+from .tools import TOOL_KIND
+
+logger = logging.getLogger(__name__)
+
+# Gemini's default temperature when the request doesn't set one
+_DEFAULT_TEMPERATURE = 1.0
+
+
+def _has_error(response: dict) -> bool:
+    """Checks a tool result, and the lookups nested in composite ones, for a failure."""
+    if response.get("status") == "error":
+        return True
+    return any(isinstance(value, dict) and _has_error(value) for value in response.values())
+
+
+class SemanticCache:
+    """Returns a previous answer when a new user turn is close enough to a cached one.
+
+    Only the opening message of a session is considered: later turns depend
+    on the conversation so far ("yes", "tell me more") and must not be
+    answered from another session. That message is embedded and compared by
+    cosine similarity against previously answered ones. Answers are only
+    admitted when every tool called in the turn is INFORMATIONAL in
+    `TOOL_KIND`, none of its tool calls failed, and the model is sampling
+    near-deterministically.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        max_entries: int = 512,
+        embedding_model: str = "text-embedding-004",
+        max_temperature: float = 0.2,
+    ):
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._embedding_model = embedding_model
+        self._max_temperature = max_temperature
+        self._client: Optional[genai.Client] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: list[str] = []
+        # Embedding and admission flag per in-flight invocation
+        self._pending = TTLCache(maxsize=1024, ttl=600)
+
+    async def _embed(self, text: str) -> np.ndarray:
+        if self._client is None:
+            # Credential discovery can block on the metadata server
+            self._client = await asyncio.to_thread(genai.Client)
+        response = await self._client.aio.models.embed_content(
+            model=self._embedding_model, contents=text
+        )
+        vector = np.asarray(response.embeddings[0].values, dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def _lookup(self, vector: np.ndarray) -> Optional[str]:
+        if self._vectors is None:
+            return None
+        scores = self._vectors @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self._threshold:
+            return self._responses[best]
+        return None
+
+    def _admit(self, vector: np.ndarray, response: str) -> None:
+        if self._vectors is None:
+            self._vectors = vector[np.newaxis, :]
+        else:
+            self._vectors = np.vstack([self._vectors, vector])
+        self._responses.append(response)
+        if len(self._responses) > self._max_entries:
+            self._vectors = self._vectors[1:]
+            del self._responses[0]
+
+    @staticmethod
+    def _opening_user_text(llm_request: LlmRequest) -> Optional[str]:
+        """Returns the user's message if this is the first model call of the session."""
+        if not llm_request.contents:
+            return None
+        if any(content.role == "model" for content in llm_request.contents[:-1]):
+            return None
+        content = llm_request.contents[-1]
+        if content.role != "user" or not content.parts:
+            return None
+        if any(part.function_response for part in content.parts):
+            return None
+        text = "".join(part.text for part in content.parts if part.text)
+        return text.strip() or None
+
+    @staticmethod
+    def _turn_is_cacheable(llm_request: LlmRequest) -> bool:
+        """Checks the tool calls made since the user's message against TOOL_KIND."""
+        for content in reversed(llm_request.contents):
+            parts = content.parts or []
+            if content.role == "user" and any(part.text for part in parts):
+                break
+            for part in parts:
+                if part.function_call:
+                    if TOOL_KIND.get(part.function_call.name) != "INFORMATIONAL":
+                        return False
+                elif part.function_response:
+                    if _has_error(part.function_response.response or {}):
+                        return False
+        return True
+
+    def _is_deterministic(self, llm_request: LlmRequest) -> bool:
+        temperature = llm_request.config.temperature if llm_request.config else None
+        if temperature is None:
+            temperature = _DEFAULT_TEMPERATURE
+        return temperature <= self._max_temperature
+
+    async def before_model_callback(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Answers from the cache on a hit, otherwise tracks the turn for admission."""
+        invocation_id = callback_context.invocation_id
+        pending = self._pending.get(invocation_id)
+        if pending is not None:
+            if not self._turn_is_cacheable(llm_request):
+                pending["cacheable"] = False
+            return None
+
+        text = self._opening_user_text(llm_request)
+        if text is None:
+            return None
+        deterministic = self._is_deterministic(llm_request)
+        if self._vectors is None and not deterministic:
+            return None
+        try:
+            vector = await self._embed(text)
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
+
+        cached = self._lookup(vector)
+        if cached is not None:
+            logger.debug("Semantic cache hit for: %s", text)
+            return LlmResponse(
+                content=types.Content(role="model", parts=[types.Part(text=cached)])
+            )
+
+        if deterministic:
+            self._pending[invocation_id] = {"vector": vector, "cacheable": True}
+        return None
+
+    async def after_model_callback(
+        self, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """Admits the turn's final text answer into the cache."""
+        pending = self._pending.get(callback_context.invocation_id)
+        if pending is None or llm_response.partial or not llm_response.content:
+            return None
+
+        parts = llm_response.content.parts or []
+        planned = [part.function_call.name for part in parts if part.function_call]
+        if planned:
+            if any(TOOL_KIND.get(name) != "INFORMATIONAL" for name in planned):
+                pending["cacheable"] = False
+            return None
+
+        self._pending.pop(callback_context.invocation_id, None)
+        text = "".join(part.text for part in parts if part.text and not part.thought)
+        if text and pending["cacheable"]:
+            self._admit(pending["vector"], text)
+        return None
@@ -1,15 +1,78 @@
 """Tools module for the web navigation service agent."""
 
+import asyncio
 import logging
-import requests
-from .config import Config
+from threading import Lock
+from urllib.parse import quote
+import hishel
+import httpx
+import orjson
+from cachetools import TTLCache
+from .config import get_config
 
-configs = Config()
+configs = get_config()
 
 logger = logging.getLogger(__name__)
 
+# Kind of every agent tool. INFORMATIONAL tools are read-only, so answers that
+# only used them may be replayed from the response cache; anything else
+# (e.g. a future COMMAND tool that changes state) is never cached.
+TOOL_KIND = {
+    "get_website_services": "INFORMATIONAL",
+    "get_website_navigation": "INFORMATIONAL",
+    "get_services_and_navigation": "INFORMATIONAL",
+}
 
-def get_website_services() -> dict:
+_BASE = (configs.WEBSITE_API_URL or "").rstrip("/")
+_SERVICES_URL = f"{_BASE}/website/services"
+_NAV_URL_FMT = (_BASE + "/website/navigation/{}").format
+
+# Shared async client so connections to the backend are kept alive between
+# tool calls and concurrent tool calls in one turn don't block each other.
+# Responses are also kept in an HTTP cache, but every request through it is
+# revalidated with If-None-Match: freshness is decided by the in-process TTL
+# caches below (services_cache_ttl / navigation_cache_ttl), and the HTTP cache
+# only turns their misses into 304s instead of full bodies. Entries outlive the
+# backend's max-age so there is still something to revalidate once it passes.
+_HTTP_CACHE_TTL = 24 * 60 * 60
+_client = hishel.AsyncCacheClient(
+    storage=hishel.AsyncInMemoryStorage(ttl=_HTTP_CACHE_TTL),
+    controller=hishel.Controller(cacheable_methods=["GET"], always_revalidate=True),
+    timeout=httpx.Timeout(10.0, connect=3.0),
+    # Pool settings live on the transport, which httpx uses instead of the
+    # client's own. HTTP/2 lets concurrent tool calls share one connection.
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=2,  # retries failed connects
+    ),
+    headers={'User-Agent': 'website-agent-service/0.1.0'},
+)
+
+# Transient gateway errors are retried with exponential backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_STATUS_RETRIES = 3
+_BACKOFF_FACTOR = 0.25
+
+# The services list rarely changes, so successful responses are kept in memory
+_services_cache = TTLCache(maxsize=1, ttl=configs.services_cache_ttl)
+_services_lock = Lock()
+
+# Navigation URLs are static per section, keyed on the normalized section name
+_navigation_cache = TTLCache(maxsize=256, ttl=configs.navigation_cache_ttl)
+_navigation_lock = Lock()
+
+
+async def _get(url: str) -> httpx.Response:
+    """Sends a GET to the backend, retrying 502/503/504 responses."""
+    for attempt in range(_MAX_STATUS_RETRIES + 1):
+        response = await _client.get(url)
+        if response.status_code not in _RETRY_STATUSES or attempt == _MAX_STATUS_RETRIES:
+            return response
+        await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+
+
+async def get_website_services() -> dict:
     """Retrieves the available services for the website.
 
     Args:
@@ -22,27 +85,31 @@ def get_website_services() -> dict:
 
     """
 
+    with _services_lock:
+        cached = _services_cache.get("v")
+    if cached is not None:
+        return cached
+
     try:
-        url = f"{configs.WEBSITE_API_URL}/website/services"
-        logger.info("Making request to: %s", url)
-        response = requests.get(
-            url,
-            timeout=30,  # 30 second timeout
-            headers={'User-Agent': 'website-agent-service/0.1.0'}
-        )
+        url = _SERVICES_URL
+        logger.debug("Making request to: %s", url)
+        response = await _get(url)
         response.raise_for_status()  # Raise exception for HTTP errors
-        return {"services": response.json()}
-    except requests.exceptions.Timeout:
+        result = {"services": orjson.loads(response.content)}
+        with _services_lock:
+            _services_cache["v"] = result
+        return result
+    except httpx.TimeoutException:
         logger.error("Timeout while fetching website services")
         return {"status": "error", "message": "Service request timed out"}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("Error fetching website services: %s", e)
         return {"status": "error", "message": "Failed to retrieve services"}
     except Exception as e:
         logger.error("Unexpected error fetching website services: %s", e)
         return {"status": "error", "message": "Failed to retrieve services"}
 
-def get_website_navigation(section: str) -> dict:
+async def get_website_navigation(section: str) -> dict:
     """Retrieves the navigation links for a specific website section.
 
     Args:
@@ -54,27 +121,55 @@ def get_website_navigation(section: str) -> dict:
 
     """
 
+    key = section.strip().lower()
+    with _navigation_lock:
+        cached = _navigation_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        url = f"{configs.WEBSITE_API_URL}/website/navigation/{section}"
-        logger.info("Making request to: %s", url)
-        response = requests.get(
-            url,
-            timeout=30,  # 30 second timeout
-            headers={'User-Agent': 'website-agent-service/0.1.0'}
-        )
+        url = _NAV_URL_FMT(quote(key, safe=""))
+        logger.debug("Making request to: %s", url)
+        response = await _get(url)
         response.raise_for_status()  # Raise exception for HTTP errors
 
-        response_data = response.json()
-        return {
+        response_data = orjson.loads(response.content)
+        result = {
             "status": "success",
-            "navigation": response_data.get("url")  
+            "navigation": response_data.get("url")
         }
-    except requests.exceptions.Timeout:
+        with _navigation_lock:
+            _navigation_cache[key] = result
+        return result
+    except httpx.TimeoutException:
         logger.error("Timeout while fetching website navigation for section: %s", section)
         return {"status": "error", "message": "Navigation request timed out"}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("Error fetching website navigation for section %s: %s", section, e)
         return {"status": "error", "message": "Failed to retrieve navigation links"}
     except Exception as e:
         logger.error("Unexpected error fetching website navigation for section %s: %s", section, e)
-        return {"status": "error", "message": "Failed to retrieve navigation links"}
\ No newline at end of file
+        return {"status": "error", "message": "Failed to retrieve navigation links"}
+
+
+async def get_services_and_navigation(section: str) -> dict:
+    """Retrieves the available services and the navigation links for a website section in one call.
+
+    Use this instead of calling `get_website_services` and `get_website_navigation`
+    separately when both are needed; the two lookups run concurrently.
+
+    Args:
+        section: The website section to retrieve navigation links for.
+
+    Returns:
+        A dictionary with the results of both lookups. Example:
+        {'services': {'services': [{'id': '1', 'name': 'Web Hosting', 'description': 'Reliable web hosting services'}]},
+         'navigation': {'status': 'success', 'navigation': 'https://example.com/navigation/section'}}
+
+    """
+
+    services, navigation = await asyncio.gather(
+        get_website_services(),
+        get_website_navigation(section),
+    )
+    return {"services": services, "navigation": navigation}
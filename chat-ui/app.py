@@ -28,10 +28,13 @@ Architecture:
 
 import streamlit as st
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import time
 import uuid
-from typing import Dict, List, Optional, Any
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Any
 import os
 
 # Set page config
@@ -42,25 +45,40 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# (connect, read) timeouts in seconds: an unreachable endpoint fails fast, a slow agent still has time to answer
+CONNECT_TIMEOUT = 5
+MESSAGE_TIMEOUT = (CONNECT_TIMEOUT, 60)
+
 class CloudRunADKClient:
     """Client for ADK agents deployed on Google Cloud Run"""
     
     def __init__(self, service_url: str):
         self.service_url = service_url.rstrip('/')
+        # Name of the endpoint that last answered, tried first on later messages
+        self.preferred_endpoint: Optional[str] = None
+        
+        # Reuse connections to the service across calls instead of a new TLS handshake each time
+        self.session = requests.Session()
+        # urllib3 decodes brotli responses once the brotli package is installed
+        self.session.headers.update({"Content-Type": "application/json", "Accept-Encoding": "br, gzip"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
-    
-    def _get_headers(self):
-        """Get appropriate headers"""
-        headers = {"Content-Type": "application/json"}
-        return headers
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
     
     def health_check(self) -> Dict:
         """Check if the Cloud Run service is healthy"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.service_url}/health",
-                headers=self._get_headers(),
-                timeout=10
+                timeout=(CONNECT_TIMEOUT, 10)
             )
             
             return {
@@ -80,11 +98,10 @@ class CloudRunADKClient:
         
         try:
             # Try standard ADK session creation
-            response = requests.post(
+            response = self.session.post(
                 f"{self.service_url}/apps/{app_name}/users/{user_id}/sessions/{session_id}",
-                headers=self._get_headers(),
-                json={},
-                timeout=30
+                data=b"{}",
+                timeout=(CONNECT_TIMEOUT, 30)
             )
             
             if response.status_code == 200:
@@ -106,24 +123,25 @@ class CloudRunADKClient:
                 "error": f"Connection error: {str(e)}"
             }
     
-    def send_message_run_endpoint(self, message: str, user_id: Optional[str] = None, session_id: Optional[str] = None, app_name: str = "agent") -> Dict:
-        """Send message using the /run endpoint"""
-        try:
-            payload = {
-                "appName": app_name,
-                "userId": user_id or f"user-{int(time.time())}",
-                "sessionId": session_id,
-                "newMessage": {
-                    "role": "user",
-                    "parts": [{"text": message}]
-                }
+    def build_run_payload(self, message: str, user_id: Optional[str] = None, session_id: Optional[str] = None, app_name: str = "agent") -> bytes:
+        """Serialize the ADK run request body shared by /run and /run_sse"""
+        return orjson.dumps({
+            "appName": app_name,
+            "userId": user_id or f"user-{int(time.time())}",
+            "sessionId": session_id,
+            "newMessage": {
+                "role": "user",
+                "parts": [{"text": message}]
             }
-            
-            response = requests.post(
+        })
+    
+    def send_message_run_endpoint(self, payload: bytes) -> Dict:
+        """Send a payload from build_run_payload using the /run endpoint"""
+        try:
+            response = self.session.post(
                 f"{self.service_url}/run",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=120
+                data=payload,
+                timeout=MESSAGE_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -143,54 +161,58 @@ class CloudRunADKClient:
                 "error": f"Connection error: {str(e)}"
             }
     
-    def send_message_run_sse(self, message: str, user_id: Optional[str] = None, session_id: Optional[str] = None, app_name: str = "agent") -> Dict:
-        """Send message using the /run_sse endpoint (Server-Sent Events)"""
-        try:
-            payload = {
-                "appName": app_name,
-                "userId": user_id or f"user-{int(time.time())}",
-                "sessionId": session_id,
-                "newMessage": {
-                    "role": "user",
-                    "parts": [{"text": message}]
-                }
-            }
+    def send_message_run_sse(self, payload: bytes) -> Iterator[Dict]:
+        """Send a payload from build_run_payload using the /run_sse endpoint (Server-Sent Events), yielding each event as it arrives"""
+        # For SSE, we'll get a streaming response
+        with self.session.post(
+            f"{self.service_url}/run_sse",
+            data=payload,
+            # A compressed event stream would be buffered until the encoder flushes
+            headers={"Accept-Encoding": "identity"},
+            timeout=MESSAGE_TIMEOUT,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise requests.exceptions.HTTPError(
+                    f"HTTP {response.status_code}: {response.text}",
+                    response=response
+                )
             
-            # For SSE, we'll get a streaming response
-            response = requests.post(
-                f"{self.service_url}/run_sse",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=120,
-                stream=True
-            )
+            # SSE is always UTF-8, whatever charset the Content-Type claims
+            response.encoding = "utf-8"
             
-            if response.status_code == 200:
-                # Collect all SSE events
-                events = []
-                for line in response.iter_lines(decode_unicode=True):
-                    if line.startswith('data: '):
-                        try:
-                            event_data = json.loads(line[6:])  # Remove 'data: ' prefix
-                            events.append(event_data)
-                        except json.JSONDecodeError:
-                            continue
-                
-                return {
-                    "success": True,
-                    "response": events
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}"
-                }
-                
-        except requests.exceptions.RequestException as e:
-            return {
-                "success": False,
-                "error": f"Connection error: {str(e)}"
-            }
+            # Proxies may split or coalesce chunks, so buffer until a blank line ends each event
+            buffer = ""
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                buffer = (buffer + chunk).replace("\r\n", "\n")
+                *blocks, buffer = buffer.split("\n\n")
+                for block in blocks:
+                    event = self._parse_sse_event(block)
+                    if event is not None:
+                        yield event
+            
+            # The stream may end without a trailing blank line
+            event = self._parse_sse_event(buffer)
+            if event is not None:
+                yield event
+    
+    @staticmethod
+    def _parse_sse_event(block: str) -> Optional[Dict]:
+        """Parse one SSE event block, joining multi-line data fields into a single JSON payload"""
+        data_lines = []
+        for line in block.split("\n"):
+            if line.startswith("data:"):
+                value = line[5:]
+                data_lines.append(value[1:] if value.startswith(" ") else value)
+        
+        data = "\n".join(data_lines)
+        if not data or data == "[DONE]":
+            return None
+        
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return None
     
     def send_message_simple(self, message: str, user_id: Optional[str] = None, session_id: Optional[str] = None) -> Dict:
         """Send message using simple chat endpoint"""
@@ -202,11 +224,10 @@ class CloudRunADKClient:
             if session_id:
                 payload["session_id"] = session_id
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.service_url}/chat",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=120
+                data=orjson.dumps(payload),
+                timeout=MESSAGE_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -235,11 +256,10 @@ class CloudRunADKClient:
                 "session_id": session_id
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.service_url}/",
-                headers=self._get_headers(),
-                json=payload,
-                timeout=120
+                data=orjson.dumps(payload),
+                timeout=MESSAGE_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -259,6 +279,41 @@ class CloudRunADKClient:
                 "error": f"Connection error: {str(e)}"
             }
     
+    def _extract_from_events(self, events: List[Any], result: Dict) -> None:
+        """Add the text and tool parts of an ADK event list to result in place"""
+        text_parts: List[str] = []
+        add_text = text_parts.append
+        add_tool_call = result['tool_calls'].append
+        add_tool_response = result['tool_responses'].append
+        
+        # Flatten every event's parts into one stream of (is_model, part) pairs
+        contents = (event.get("content", {}) for event in events if isinstance(event, dict))
+        parts = chain.from_iterable(
+            ((content.get("role") == "model", part) for part in content.get("parts", ()))
+            for content in contents
+        )
+        
+        # Classify each part once: model text, function call or function response
+        for is_model, part in parts:
+            if "text" in part:
+                if is_model and part["text"]:
+                    add_text(part["text"])
+            elif "functionCall" in part:
+                func_call = part["functionCall"]
+                add_tool_call({
+                    'name': func_call.get('name', 'unknown'),
+                    'args': func_call.get('args', {})
+                })
+            elif "functionResponse" in part:
+                func_response = part["functionResponse"]
+                add_tool_response({
+                    'name': func_response.get('name', 'unknown'),
+                    'response': func_response.get('response', {})
+                })
+        
+        if text_parts:
+            result['final_text'] = " ".join(text_parts)
+    
     def process_response(self, response_data: Any) -> Dict:
         """Process Cloud Run response to extract text and tool information"""
         result = {
@@ -274,35 +329,7 @@ class CloudRunADKClient:
             # Handle ADK-style event list
             if isinstance(response_data, list):
                 result['events'] = response_data
-                
-                for event in response_data:
-                    if isinstance(event, dict):
-                        content = event.get("content", {})
-                        
-                        # Extract model responses
-                        if content.get("role") == "model":
-                            parts = content.get("parts", [])
-                            for part in parts:
-                                if "text" in part and part["text"]:
-                                    result['final_text'] += part["text"] + " "
-                        
-                        # Extract function calls
-                        parts = content.get("parts", [])
-                        for part in parts:
-                            if "functionCall" in part:
-                                func_call = part["functionCall"]
-                                result['tool_calls'].append({
-                                    'name': func_call.get('name', 'unknown'),
-                                    'args': func_call.get('args', {})
-                                })
-                            
-                            # Extract function responses
-                            elif "functionResponse" in part:
-                                func_response = part["functionResponse"]
-                                result['tool_responses'].append({
-                                    'name': func_response.get('name', 'unknown'),
-                                    'response': func_response.get('response', {})
-                                })
+                self._extract_from_events(response_data, result)
             
             # Handle direct response object
             elif isinstance(response_data, dict):
@@ -321,14 +348,9 @@ class CloudRunADKClient:
                         result['final_text'] = content['text']
                 
                 # Handle events field
-                if 'events' in response_data:
+                if isinstance(response_data.get('events'), list):
                     result['events'] = response_data['events']
-                    # Process events recursively
-                    events_result = self.process_response(response_data['events'])
-                    if events_result['final_text']:
-                        result['final_text'] = events_result['final_text']
-                    result['tool_calls'].extend(events_result['tool_calls'])
-                    result['tool_responses'].extend(events_result['tool_responses'])
+                    self._extract_from_events(response_data['events'], result)
                 
                 # If no text found, try to stringify the response nicely
                 if not result['final_text']:
@@ -336,7 +358,7 @@ class CloudRunADKClient:
                     clean_response = {k: v for k, v in response_data.items() 
                                     if k not in ['timestamp', 'request_id', 'metadata', 'status']}
                     if clean_response:
-                        result['final_text'] = json.dumps(clean_response, indent=2)
+                        result['final_text'] = orjson.dumps(clean_response, option=orjson.OPT_INDENT_2).decode()
             
             # Handle string response
             elif isinstance(response_data, str):
@@ -361,20 +383,24 @@ class CloudRunADKClient:
                 'raw_response': response_data
             }
 
+@st.cache_resource
+def get_client(service_url: str) -> CloudRunADKClient:
+    """Get the client for a service URL, shared across reruns and browser sessions"""
+    return CloudRunADKClient(service_url)
+
 # Initialize session state
 def initialize_session_state():
-    """Initialize Streamlit session state variables"""
-    if "user_id" not in st.session_state:
-        st.session_state.user_id = f"user-{uuid.uuid4()}"
-    
-    if "session_id" not in st.session_state:
-        st.session_state.session_id = None
-    
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    """Initialize Streamlit session state variables once per browser session"""
+    if st.session_state.get("_initialized"):
+        return
     
-    if "client" not in st.session_state:
-        st.session_state.client = None
+    st.session_state.user_id = f"user-{uuid.uuid4()}"
+    st.session_state.session_id = None
+    st.session_state.messages = []
+    # Raw responses kept for the debug view only, keyed by message index
+    st.session_state.debug_by_id = {}
+    st.session_state.client = None
+    st.session_state._initialized = True
 
 def send_message_with_streaming(client: CloudRunADKClient, message: str, app_name: str, thinking_placeholder):
     """Send message using streaming with thinking indicator"""
@@ -386,27 +412,39 @@ def send_message_with_streaming(client: CloudRunADKClient, message: str, app_nam
     # Show initial thinking indicator
     with thinking_placeholder.container():
         with st.chat_message("assistant"):
-            with st.spinner("🤖 Agent is thinking..."):
-                time.sleep(0.5)  # Show spinner for a moment
+            st.write("🤖 Agent is thinking...")
+    
+    # Serialize the ADK request once so every attempt sends the same body and IDs
+    run_payload = client.build_run_payload(message, user_id, session_id, app_name)
     
     # Try SSE endpoint first for streaming, then fallback to regular endpoints
     endpoints_to_try = [
-        ("POST /run_sse", lambda: client.send_message_run_sse(message, user_id, session_id, app_name), True),
-        ("POST /run", lambda: client.send_message_run_endpoint(message, user_id, session_id, app_name), False),
+        ("POST /run_sse", lambda: client.send_message_run_sse(run_payload), True),
+        ("POST /run", lambda: client.send_message_run_endpoint(run_payload), False),
         ("/chat", lambda: client.send_message_simple(message, user_id), False),
         ("root /", lambda: client.send_message_direct(message, user_id), False)
     ]
     
+    # Go straight to the endpoint that worked last time, keeping the others as fallbacks
+    if client.preferred_endpoint:
+        endpoints_to_try.sort(key=lambda endpoint: endpoint[0] != client.preferred_endpoint)
+    
     for endpoint_name, endpoint_func, is_streaming in endpoints_to_try:
         try:
-            # Update thinking indicator for current endpoint
-            with thinking_placeholder.container():
-                with st.chat_message("assistant"):
-                    # st.write(f"🔄 Trying {endpoint_name}...")
-                    with st.spinner("Agent Thinking..."):
-                        response = endpoint_func()
+            if is_streaming:
+                # Render events in the thinking placeholder as they arrive
+                response = stream_sse_response(endpoint_func(), thinking_placeholder)
+            else:
+                # Update thinking indicator for current endpoint
+                with thinking_placeholder.container():
+                    with st.chat_message("assistant"):
+                        # st.write(f"🔄 Trying {endpoint_name}...")
+                        with st.spinner("Agent Thinking..."):
+                            response = endpoint_func()
             
             if response.get("success"):
+                client.preferred_endpoint = endpoint_name
+                
                 # Clear thinking indicator
                 thinking_placeholder.empty()
                 
@@ -428,25 +466,28 @@ def send_message_with_streaming(client: CloudRunADKClient, message: str, app_nam
                     "timestamp": time.strftime("%H:%M:%S"),
                     "tool_calls": processed['tool_calls'],
                     "tool_responses": processed['tool_responses'],
-                    "events": processed['events'],
                     "endpoint_used": endpoint_name,
-                    "raw_response": processed['raw_response'],
                     "status": processed['status']
                 }
                 
                 st.session_state.messages.append(assistant_message)
                 
-                # Display the response with streaming effect
-                display_streaming_response(assistant_message)
+                # Keep the (potentially large) raw response out of the message list unless debugging
+                raw_response = None
+                if st.session_state.get("show_debug", False):
+                    raw_response = processed['raw_response']
+                    st.session_state.debug_by_id[len(st.session_state.messages) - 1] = raw_response
+                
+                # Display the response with streaming effect, unless it was already streamed live
+                display_streaming_response(assistant_message, streamed=is_streaming, raw_response=raw_response)
                 
                 return True
                 
         except Exception as e:
-            # Show error in thinking placeholder briefly
+            # Show error in thinking placeholder until the next endpoint replaces it
             with thinking_placeholder.container():
                 with st.chat_message("assistant"):
                     st.error(f"❌ {endpoint_name} failed: {str(e)}")
-                    time.sleep(1)  # Brief delay to show error
             continue
     
     # If all endpoints failed
@@ -466,36 +507,50 @@ def send_message_with_streaming(client: CloudRunADKClient, message: str, app_nam
     
     return False
 
-def display_streaming_response(message):
+def stream_sse_response(events: Iterator[Dict], thinking_placeholder) -> Dict:
+    """Render model text from SSE events as they arrive and collect the events"""
+    collected = []
+    displayed_text = ""
+    
+    try:
+        with thinking_placeholder.container():
+            with st.chat_message("assistant"):
+                response_container = st.empty()
+                response_container.markdown("🤖 Agent is thinking...")
+                
+                for event in events:
+                    collected.append(event)
+                    if not isinstance(event, dict):
+                        continue
+                    content = event.get("content") or {}
+                    if content.get("role") != "model":
+                        continue
+                    for part in content.get("parts", []):
+                        if part.get("text"):
+                            displayed_text += part["text"] + " "
+                            response_container.markdown(displayed_text + "▌")  # Show cursor
+    except requests.exceptions.RequestException as e:
+        return {
+            "success": False,
+            "error": f"Connection error: {str(e)}"
+        }
+    
+    return {
+        "success": True,
+        "response": collected
+    }
+
+def display_streaming_response(message, streamed: bool = False, raw_response: Any = None):
     """Display response with streaming effect"""
     with st.chat_message("assistant"):
-        # Show initial processing indicator
-        response_container = st.empty()
-        
-        with response_container.container():
-            st.write("💭 Processing response...")
-            time.sleep(1)
-        
         content = message["content"]
         
-        # If content is short, show it all at once
-        if len(content) < 100:
-            response_container.markdown(content)
+        # If content is short or was already streamed live, show it all at once
+        if streamed or len(content) < 100:
+            st.markdown(content)
         else:
-            # Stream the text word by word for longer content
-            words = content.split()
-            displayed_text = ""
-            
-            for i, word in enumerate(words):
-                displayed_text += word + " "
-                
-                # Update every few words for better performance
-                if i % 3 == 0 or i == len(words) - 1:
-                    response_container.markdown(displayed_text + "▌")  # Show cursor
-                    time.sleep(0.08)  # Adjust speed as needed
-            
-            # Final display without cursor
-            response_container.markdown(content)
+            # Stream the text word by word for longer content, paced by Streamlit itself
+            st.write_stream(word + " " for word in content.split(" "))
         
         # Show timestamp and endpoint info
         caption_parts = [f"🕒 {message['timestamp']}"]
@@ -519,9 +574,101 @@ def display_streaming_response(message):
                             st.json(tool_response['response'])
         
         # Show raw response for debugging
-        if (message.get("raw_response") and st.session_state.get("show_debug", False)):
+        if (raw_response and st.session_state.get("show_debug", False)):
             with st.expander("🐛 Debug: Raw Response"):
-                st.json(message["raw_response"])
+                st.json(raw_response)
+
+@st.fragment
+def render_config_form():
+    """Sidebar configuration form, rerun on its own so chat input doesn't rebuild it"""
+    with st.form("config_form"):
+        st.subheader("Service Configuration")
+        
+        service_url = st.text_input(
+            "Cloud Run Service URL",
+            value=st.session_state.get("service_url", ""),
+            help="Your Cloud Run service URL (e.g., https://your-service-123abc-uc.a.run.app)",
+            placeholder="https://your-service-123abc-uc.a.run.app"
+        )
+        
+        app_name = st.text_input(
+            "App Name",
+            value=st.session_state.get("app_name", ""),
+            help="Name of your ADK agent application deployed",
+            placeholder="Your App Name"
+        )
+        
+        
+        submitted = st.form_submit_button("💾 Save Configuration")
+        
+        # Normalize so "https://x.run.app/" and "https://x.run.app" share one cached client
+        service_url = service_url.strip().rstrip("/")
+        if submitted and service_url:
+            try:
+                st.session_state.client = get_client(service_url)
+                st.session_state.service_url = service_url
+                st.session_state.app_name = app_name
+                # Full rerun so the chat area picks up the new client
+                st.rerun()
+            except Exception as e:
+                st.error(f"❌ Configuration failed: {str(e)}")
+
+@st.fragment
+def render_history():
+    """Chat history and debug toggle, rerun on its own when the toggle changes"""
+    for index, message in enumerate(st.session_state.messages):
+        if message["role"] == "user":
+            with st.chat_message("user"):
+                st.markdown(message["content"])
+                st.caption(f"🕒 {message['timestamp']}")
+        elif message["role"] == "assistant":
+            with st.chat_message("assistant"):
+                st.markdown(message["content"])
+                
+                # Show timestamp and endpoint info
+                caption_parts = [f"🕒 {message['timestamp']}"]
+                if message.get("endpoint_used"):
+                    caption_parts.append(f"📡 {message['endpoint_used']}")
+                st.caption(" | ".join(caption_parts))
+                
+                # Show tool details for assistant messages
+                if (message.get("tool_calls") and len(message["tool_calls"]) > 0):
+                    with st.expander(f"🔧 Tool Details ({len(message['tool_calls'])} calls)"):
+                        for j, tool_call in enumerate(message["tool_calls"]):
+                            st.write(f"**Call {j+1}:** {tool_call['name']}")
+                            if tool_call.get('args'):
+                                st.json(tool_call['args'])
+                        
+                        if message.get("tool_responses"):
+                            st.write("**Responses:**")
+                            for j, tool_response in enumerate(message["tool_responses"]):
+                                st.write(f"**Response {j+1}:** {tool_response['name']}")
+                                if tool_response.get('response'):
+                                    st.json(tool_response['response'])
+                
+                # Show raw response for debugging
+                raw_response = st.session_state.debug_by_id.get(index)
+                if (raw_response and st.session_state.get("show_debug", False)):
+                    with st.expander("🐛 Debug: Raw Response"):
+                        st.json(raw_response)
+    
+    # Answer a message just sent from the chat input; popped so toggling debug doesn't resend it
+    pending_input = st.session_state.pop("pending_input", None)
+    if pending_input:
+        # Create placeholder for thinking indicator
+        thinking_placeholder = st.empty()
+        
+        # Send message with streaming
+        send_message_with_streaming(
+            st.session_state.client, 
+            pending_input, 
+            st.session_state.get("app_name", "agent"),
+            thinking_placeholder
+        )
+    
+    # Debug toggle
+    if st.session_state.messages:
+        st.session_state.show_debug = st.checkbox("Show debug info", value=False)
 
 def main():
     """Main application function"""
@@ -533,36 +680,7 @@ def main():
         st.title(":robot: Cloud Run Agent")
 
         # Configuration form
-        with st.form("config_form"):
-            st.subheader("Service Configuration")
-            
-            service_url = st.text_input(
-                "Cloud Run Service URL",
-                value=st.session_state.get("service_url", ""),
-                help="Your Cloud Run service URL (e.g., https://your-service-123abc-uc.a.run.app)",
-                placeholder="https://your-service-123abc-uc.a.run.app"
-            )
-            
-            app_name = st.text_input(
-                "App Name",
-                value=st.session_state.get("app_name", ""),
-                help="Name of your ADK agent application deployed",
-                placeholder="Your App Name"
-            )
-            
-            
-            submitted = st.form_submit_button("💾 Save Configuration")
-            
-            if submitted and service_url:
-                try:
-                    st.session_state.client = CloudRunADKClient(
-                        service_url=service_url
-                    )
-                    st.session_state.service_url = service_url
-                    st.session_state.app_name = app_name
-                    st.success("✅ Configuration saved!")
-                except Exception as e:
-                    st.error(f"❌ Configuration failed: {str(e)}")
+        render_config_form()
         
         st.divider()
         
@@ -582,6 +700,7 @@ def main():
                     if result.get("success"):
                         st.session_state.session_id = result["session_id"]
                         st.session_state.messages = []
+                        st.session_state.debug_by_id = {}
                         st.rerun()
                     else:
                         st.error(f"Failed to create session: {result.get('error')}")
@@ -603,6 +722,7 @@ def main():
         
         if st.button("🗑️ Clear Chat"):
             st.session_state.messages = []
+            st.session_state.debug_by_id = {}
             st.rerun()
         
         st.divider()
@@ -622,74 +742,18 @@ def main():
         st.info("👈 Please configure your Cloud Run service URL in the sidebar to get started.")
         return
     
-    # Display chat messages (excluding the last assistant message if it will be streamed)
-    messages_to_display = st.session_state.messages.copy()
-    
-    for message in messages_to_display:
-        if message["role"] == "user":
-            with st.chat_message("user"):
-                st.markdown(message["content"])
-                st.caption(f"🕒 {message['timestamp']}")
-        elif message["role"] == "assistant":
-            with st.chat_message("assistant"):
-                st.markdown(message["content"])
-                
-                # Show timestamp and endpoint info
-                caption_parts = [f"🕒 {message['timestamp']}"]
-                if message.get("endpoint_used"):
-                    caption_parts.append(f"📡 {message['endpoint_used']}")
-                st.caption(" | ".join(caption_parts))
-                
-                # Show tool details for assistant messages
-                if (message.get("tool_calls") and len(message["tool_calls"]) > 0):
-                    with st.expander(f"🔧 Tool Details ({len(message['tool_calls'])} calls)"):
-                        for j, tool_call in enumerate(message["tool_calls"]):
-                            st.write(f"**Call {j+1}:** {tool_call['name']}")
-                            if tool_call.get('args'):
-                                st.json(tool_call['args'])
-                        
-                        if message.get("tool_responses"):
-                            st.write("**Responses:**")
-                            for j, tool_response in enumerate(message["tool_responses"]):
-                                st.write(f"**Response {j+1}:** {tool_response['name']}")
-                                if tool_response.get('response'):
-                                    st.json(tool_response['response'])
-                
-                # Show raw response for debugging
-                if (message.get("raw_response") and st.session_state.get("show_debug", False)):
-                    with st.expander("🐛 Debug: Raw Response"):
-                        st.json(message["raw_response"])
-    
-    # Debug toggle
-    if st.session_state.messages:
-        st.session_state.show_debug = st.checkbox("Show debug info", value=False)
-    
-    # Chat input
+    # Chat input, pinned to the bottom of the page wherever it is called
     if user_input := st.chat_input("Type your message here..."):
-        # Add user message to chat immediately
+        # Add user message to chat; render_history() draws it and sends it to the agent
         st.session_state.messages.append({
             "role": "user", 
             "content": user_input,
             "timestamp": time.strftime("%H:%M:%S")
         })
-        
-        # Display user message immediately
-        with st.chat_message("user"):
-            st.markdown(user_input)
-            st.caption(f"🕒 {time.strftime('%H:%M:%S')}")
-        
-        # Create placeholder for thinking indicator
-        thinking_placeholder = st.empty()
-        
-        # Send message with streaming
-        send_message_with_streaming(
-            st.session_state.client, 
-            user_input, 
-            st.session_state.get("app_name", "agent"),
-            thinking_placeholder
-        )
-        
-        st.rerun()
+        st.session_state.pending_input = user_input
+    
+    # Display chat messages
+    render_history()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
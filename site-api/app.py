@@ -1,38 +1,98 @@
 # app.py
 
-from fastapi import APIRouter
+import hashlib
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from service.website import WebsiteService
 from config.logging import get_logger
 
 
 logger = get_logger()
-website_service = WebsiteService()
+
+# Seconds clients and this process may reuse a response
+CACHE_MAX_AGE = 300
+
+# Serialized body and ETag per endpoint (and per section for navigation)
+_services_cache = TTLCache(maxsize=1, ttl=CACHE_MAX_AGE)
+_navigation_cache = TTLCache(maxsize=128, ttl=CACHE_MAX_AGE)
+
+
+async def get_website_service(request: Request) -> WebsiteService:
+    """
+    Provides the WebsiteService created by the application lifespan.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        WebsiteService: The per-process service instance.
+    """
+    return request.app.state.website
+
+
+def _with_etag(body: bytes) -> tuple[bytes, str]:
+    """
+    Pairs a serialized response body with its ETag.
+
+    Args:
+        body (bytes): The JSON body.
+
+    Returns:
+        tuple[bytes, str]: The JSON body and its quoted ETag.
+    """
+    return body, f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+
+def _cached_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Builds a cacheable JSON response, or a 304 if the client already has it.
+
+    Args:
+        request (Request): The incoming request.
+        body (bytes): The serialized JSON body.
+        etag (str): The quoted ETag of the body.
+
+    Returns:
+        Response: A 200 with the body, or an empty 304 Not Modified.
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={CACHE_MAX_AGE}"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 router = APIRouter(
     prefix="/website",
+    default_response_class=ORJSONResponse,
     responses={404: {"description": "Not found"}},
 )
 
     
 @router.get("/services", tags=["website"])
-async def get_service_details():
+async def get_service_details(request: Request, website_service: WebsiteService = Depends(get_website_service)):
     """
     Retrieves details of the website service.
     
     Returns:
-        dict: A dictionary containing service details.
+        Response: The service details as JSON, or 304 if unchanged.
     """
     try:
-        logger.info("GET /website/services endpoint called")
-        service_details = website_service.getServiceDetails()
-        logger.info("Successfully retrieved service details")
-        return service_details
+        logger.debug("GET /website/services endpoint called")
+        cached = _services_cache.get("services")
+        if cached is None:
+            service_details = await website_service.getServiceDetailsBytes()
+            cached = _services_cache["services"] = _with_etag(service_details)
+        logger.debug("Successfully retrieved service details")
+        return _cached_response(request, *cached)
     except Exception as error:
-        logger.error(f"Error while retrieving service details: {error}")
-        return {"error": f"Error while retrieving service details. Error -> {error}"}   
+        logger.exception("Error while retrieving service details")
+        raise HTTPException(status_code=500, detail=str(error)) from error
     
 @router.get("/navigation/{section}", tags=["website"])
-async def get_navigation_section(section: str):
+async def get_navigation_section(section: str, request: Request, website_service: WebsiteService = Depends(get_website_service)):
     """
     Retrieves the navigation section details.
 
@@ -40,13 +100,18 @@ async def get_navigation_section(section: str):
         section (str): The specific section to retrieve.
 
     Returns:
-        dict: A dictionary containing the navigation section details.
+        Response: The navigation section details as JSON, or 304 if unchanged.
     """
     try:
-        logger.info(f"GET /website/navigation/{section} endpoint called")
-        section_details = website_service.getWebsitePageUrl(section)
-        logger.info(f"Successfully retrieved navigation section details for: {section}")
-        return section_details
+        logger.debug("GET /website/navigation/%s endpoint called", section)
+        # Sections are matched case-insensitively, so share one entry per section
+        key = section.lower()
+        cached = _navigation_cache.get(key)
+        if cached is None:
+            section_details = await website_service.getWebsitePageUrl(section)
+            cached = _navigation_cache[key] = _with_etag(orjson.dumps(section_details))
+        logger.debug("Successfully retrieved navigation section details for: %s", section)
+        return _cached_response(request, *cached)
     except Exception as error:
-        logger.error(f"Error while retrieving navigation section '{section}': {error}")
-        return {"error": f"Error while retrieving navigation section. Error -> {error}"}
+        logger.exception("Error while retrieving navigation section '%s'", section)
+        raise HTTPException(status_code=500, detail=str(error)) from error
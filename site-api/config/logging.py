@@ -1,10 +1,30 @@
+import atexit
 import logging
+import logging.handlers
 import json
+import os
+import queue
+import sys
+from functools import partial
 from typing import Optional
 from google.cloud import logging as gcp_logging
-from google.cloud.logging.handlers import CloudLoggingHandler
+from google.cloud.logging.handlers import CloudLoggingHandler, StructuredLogHandler
+from google.cloud.logging.handlers.transports import BackgroundThreadTransport
+from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 
+# Entries per entries.write call and the longest a partial batch may wait, in seconds
+CLOUD_LOGGING_BATCH_SIZE = 50
+CLOUD_LOGGING_MAX_LATENCY = 2.0
+
+# Set by Cloud Run, App Engine and GKE, whose log agents ingest JSON lines from stdout
+_MANAGED_PLATFORM_ENV_VARS = ("K_SERVICE", "GAE_SERVICE", "KUBERNETES_SERVICE_HOST")
+
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 
 def setup_logging(project_id: Optional[str] = None, log_level: str = "INFO", credentials_dict: Optional[dict] = None):
     """
@@ -18,60 +38,97 @@ def setup_logging(project_id: Optional[str] = None, log_level: str = "INFO", cre
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _listener, _queue_handler
     logger = logging.getLogger("website-api")
     
     if logger.handlers:
         return logger
     
-    logger.setLevel(getattr(logging, log_level.upper()))
+    level = getattr(logging, log_level.upper(), logging.INFO)
+    logger.setLevel(level)
     
-    if project_id and credentials_dict:
+    if any(os.environ.get(name) for name in _MANAGED_PLATFORM_ENV_VARS):
+        # The platform ships stdout to Cloud Logging, so skip the API client entirely
+        structured_handler = StructuredLogHandler(project_id=project_id, stream=sys.stdout)
+        structured_handler.setLevel(level)
+        logger.addHandler(structured_handler)
+        logger.info("Structured logging to stdout configured")
+    elif project_id and credentials_dict:
         try:
-            credentials = service_account.Credentials.from_service_account_info(credentials_dict)
+            # Scoped up front so the client reuses these credentials, and the token
+            # fetched here at startup, instead of making its own scoped copy
+            credentials = service_account.Credentials.from_service_account_info(
+                credentials_dict, scopes=gcp_logging.Client.SCOPE
+            )
+            credentials.refresh(Request())
             client = gcp_logging.Client(project=project_id, credentials=credentials)
             
-            cloud_handler = CloudLoggingHandler(client, name="website-api")
-            cloud_handler.setLevel(getattr(logging, log_level.upper()))
-            
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            cloud_handler = CloudLoggingHandler(
+                client,
+                name="website-api",
+                transport=partial(
+                    BackgroundThreadTransport,
+                    batch_size=CLOUD_LOGGING_BATCH_SIZE,
+                    max_latency=CLOUD_LOGGING_MAX_LATENCY,
+                ),
             )
-            cloud_handler.setFormatter(formatter)
+            cloud_handler.setLevel(level)
+            cloud_handler.setFormatter(_FORMATTER)
+            
+            # Request code only enqueues records; a background thread formats and ships them
+            log_queue = queue.Queue(-1)
+            _listener = logging.handlers.QueueListener(log_queue, cloud_handler, respect_handler_level=True)
+            _listener.start()
+            atexit.register(stop_logging)
             
-            logger.addHandler(cloud_handler)
+            _queue_handler = logging.handlers.QueueHandler(log_queue)
+            logger.addHandler(_queue_handler)
             logger.info("Google Cloud Logging configured successfully")
             
         except Exception as e:
             logger.warning(f"Failed to configure Google Cloud Logging: {e}")
-            _setup_console_logging(logger, log_level)
+            _setup_console_logging(logger, level)
     else:
         if not credentials_dict:
             logger.info("No Google Cloud credentials provided, using console logging")
-        _setup_console_logging(logger, log_level)
+        _setup_console_logging(logger, level)
     
     return logger
 
 
-def _setup_console_logging(logger: logging.Logger, log_level: str):
+def _setup_console_logging(logger: logging.Logger, level: int):
     """
     Fallback to console logging when Google Cloud Logging is not available.
     
     Args:
         logger (logging.Logger): Logger instance
-        log_level (str): Logging level
+        level (int): Logging level
     """
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_handler.setFormatter(formatter)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(_FORMATTER)
     
     logger.addHandler(console_handler)
     logger.info("Console logging configured as fallback")
 
 
+def stop_logging():
+    """
+    Flush queued log records and stop the background logging thread, if any.
+
+    The queued handlers are attached to the logger directly, so records logged
+    afterwards (e.g. by a later lifespan in the same process) are still delivered.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        logger = get_logger()
+        for handler in _listener.handlers:
+            logger.addHandler(handler)
+        logger.removeHandler(_queue_handler)
+        _listener.stop()
+        _listener = _queue_handler = None
+
+
 def get_logger() -> logging.Logger:
     """
     Get the configured logger instance.
@@ -1,5 +1,6 @@
 from starlette.config import Config
-import json
+from functools import cache, cached_property
+import orjson
 from pathlib import Path
 import os
 
@@ -12,8 +13,8 @@ def parse_json_credentials(value):
     if value is None:
         return None
     try:
-        return json.loads(value)
-    except json.JSONDecodeError:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
         raise ValueError(f"Invalid JSON format for credentials: {value[:50]}...")
 
 class Settings:
@@ -21,6 +22,17 @@ class Settings:
     GCLOUD_PROJECT_ID = config("GCLOUD_PROJECT_ID", cast=str)
     GCLOUD_REGION = config("GCLOUD_REGION", cast=str, default="europe-west2")
     LOG_LEVEL = config("LOG_LEVEL", cast=str, default="INFO")
+    WEBSITE_BASE_URL = config("WEBSITE_BASE_URL", cast=str, default="http://fictionsolutions.com")
+    # os.cpu_count() reports the host's CPUs inside a container, not its CPU limit, so scale explicitly
+    WORKERS = config("WORKERS", cast=int, default=1)
     GOOGLE_APPLICATION_CREDENTIALS = config("GOOGLE_APPLICATION_CREDENTIALS", cast=parse_json_credentials, default=None)
 
-settings = Settings()
\ No newline at end of file
+    @cached_property
+    def allowed_origins_list(self) -> list[str]:
+        origins = [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
+        # A wildcard anywhere means any origin, which lets Starlette skip its per-request origin check
+        return ["*"] if "*" in origins else origins
+
+@cache
+def get_settings() -> Settings:
+    return Settings()
\ No newline at end of file
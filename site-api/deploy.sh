@@ -70,6 +70,7 @@ deploy_to_cloud_run() {
         --max-instances=${MAX_INSTANCES:-4} \
         --memory=${MEMORY:-512Mi} \
         --cpu=${CPU:-1} \
+        --update-env-vars=WORKERS=${WORKERS:-1} \
         --port=${PORT:-8000} \
         --allow-unauthenticated
 }
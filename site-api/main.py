@@ -1,8 +1,12 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app import router
-from config.settings import settings
-from config.logging import setup_logging
+from config.settings import get_settings
+from config.logging import setup_logging, stop_logging
+from service.website import WebsiteService
+
+settings = get_settings()
 
 logger = setup_logging(
     project_id=settings.GCLOUD_PROJECT_ID,
@@ -10,7 +14,18 @@ logger = setup_logging(
     credentials_dict=settings.GOOGLE_APPLICATION_CREDENTIALS
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the website data once, before the worker accepts connections
+    website_service = WebsiteService()
+    website_service.loadData()
+    app.state.website = website_service
+    yield
+    # Drain queued log records before the process exits
+    stop_logging()
+
 app = FastAPI(
+    lifespan=lifespan,
     docs_url= "/api/docs",
     redoc_url= "/api/redocs",
     title="Website Details API",
@@ -19,11 +34,9 @@ app = FastAPI(
     openapi_url="/api/openapi.json"
 )
 
-allowed_origins = [url.strip() for url in settings.ALLOWED_ORIGINS.split(",")]
-
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.allowed_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -31,7 +44,7 @@ app.add_middleware(
 
 @app.get("/")
 async def root():
-    logger.info("Root endpoint accessed")
+    logger.debug("Root endpoint accessed")
     return {"message": "Website Details API is running"}
 
 app.include_router(router)
@@ -40,4 +53,5 @@ app.include_router(router)
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting Website Details API server")
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, log_level="info", reload=True)
+    # loop/http default to "auto", which picks uvloop and httptools from uvicorn[standard] where available
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, log_level="info", workers=settings.WORKERS)
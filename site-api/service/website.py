@@ -1,16 +1,90 @@
-import json
 import os
+import sys
+from functools import cached_property, lru_cache
+from pathlib import Path
+import orjson
 from config.logging import get_logger
+from config.settings import get_settings
+
+# Navigation and services live in one file so both are parsed in a single pass
+DATA_FILE = "website.json"
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int) -> dict:
+    """
+    Parses a JSON data file, reusing the result until the file changes.
+
+    Args:
+        path (str): Path of the JSON file.
+        mtime_ns (int): The file's modification time, so edits invalidate the entry.
+
+    Returns:
+        dict: The parsed JSON document (shared, do not mutate).
+    """
+    return orjson.loads(Path(path).read_bytes())
+
 
 class WebsiteService:
     def __init__(self) -> None:
         self.logger = get_logger()
         self.logger.info("Initializing WebsiteService")
-        webdata = self.getWebsiteData()
-        self.navigation_data = webdata.get("navigation", {})
-        self.services_data = webdata.get("services", {})
-        self.logger.info(f"Loaded {len(self.navigation_data)} navigation items and {len(self.services_data)} services")
-        
+        self.base_url = get_settings().WEBSITE_BASE_URL.rstrip("/")
+        # The data file is parsed on first access to navigation_data / services_data
+        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+    def _loadDataFile(self, filename: str) -> dict:
+        """
+        Loads one JSON file from the data directory.
+
+        Args:
+            filename (str): Name of the file inside the data directory.
+
+        Returns:
+            dict: The parsed JSON document.
+        """
+        path = os.path.join(self.data_dir, filename)
+        try:
+            data = _load_json_cached(path, os.stat(path).st_mtime_ns)
+        except Exception as e:
+            self.logger.error("Error loading website data from %s: %s", path, e)
+            raise
+        self.logger.debug("Loaded website data from %s", path)
+        return data
+
+    @cached_property
+    def navigation_data(self) -> list:
+        navigation_data = self._loadDataFile(DATA_FILE).get("navigation", [])
+        self.logger.info("Loaded %d navigation items", len(navigation_data))
+        return navigation_data
+
+    @cached_property
+    def services_data(self) -> list:
+        services_data = self._loadDataFile(DATA_FILE).get("services", [])
+        self.logger.info("Loaded %d services", len(services_data))
+        return services_data
+
+    @cached_property
+    def _section_index(self) -> dict:
+        # Lowercased section -> full URL; reversed so the first entry wins on duplicates, as the old scan did
+        return {
+            sys.intern(item["section"].lower()): f"{self.base_url}{item['url']}" if item.get("url") else ""
+            for item in reversed(self.navigation_data)
+            if "section" in item
+        }
+
+    @cached_property
+    def _services_payload(self) -> bytes:
+        return orjson.dumps(self.services_data)
+
+    def loadData(self) -> None:
+        """
+        Parses the data file and builds the section index and services payload now rather than on first request.
+        """
+        self.getWebsiteData()
+        # Reading a cached_property builds it and stores the result on the instance
+        _ = self._section_index, self._services_payload
+
     def getWebsiteData(self)-> dict:
         """
         Retrieves website data from a predefined source.
@@ -18,37 +92,27 @@ class WebsiteService:
         Returns:
             dict: A dictionary containing website data.
         """
-        try:
-            # Get the current directory
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            self.logger.debug(f"Loading website data from directory: {current_dir}")
-
-            # Load website navigation data
-            navigation_path = os.path.join(current_dir, 'data', 'website-navigation.json')
-            with open(navigation_path, 'r') as f:
-                navigation_data = json.load(f)
-            self.logger.debug(f"Loaded navigation data from {navigation_path}")
-
-            # Load website services data
-            services_path = os.path.join(current_dir, 'data', 'website-services.json')
-            with open(services_path, 'r') as f:
-                services_data = json.load(f)
-            self.logger.debug(f"Loaded services data from {services_path}")
-
-            return {
-                "navigation": navigation_data.get("navigation", []),
-                "services": services_data.get("services", [])
-            }
-        except Exception as e:
-            self.logger.error(f"Error loading website data: {e}")
-            raise
+        return {
+            "navigation": self.navigation_data,
+            "services": self.services_data
+        }
 
-    def getServiceDetails(self):
-        self.logger.info("Retrieving service details")
+    async def getServiceDetails(self):
+        self.logger.debug("Retrieving service details")
         return self.services_data
+
+    async def getServiceDetailsBytes(self) -> bytes:
+        """
+        Retrieves the service details already serialized as JSON.
+
+        Returns:
+            bytes: The JSON-encoded service details, built once per instance.
+        """
+        self.logger.debug("Retrieving serialized service details")
+        return self._services_payload
     
 
-    def getWebsitePageUrl(self, section) -> dict:
+    async def getWebsitePageUrl(self, section) -> dict:
         """
         Constructs a URL for a specific section on the website.
 
@@ -58,17 +122,15 @@ class WebsiteService:
         Returns:
             str: The full URL to the specified section.
         """
-        self.logger.info(f"Retrieving URL for section: {section}")
-        self.logger.debug(f"Navigation Data: {self.navigation_data}")
+        self.logger.debug("Retrieving URL for section: %s", section)
+        self.logger.debug("Navigation Data: %s", self.navigation_data)
 
-        # Find object in JSON array navigation where section field equals section
-        web_path = [item for item in self.navigation_data if item["section"].lower() == section.lower()]
-        path_url = web_path[0].get("url", "") if len(web_path) > 0 else ""
+        url = self._section_index.get(section.lower(), "")
         
-        if path_url:
-            self.logger.info(f"Found URL for section '{section}': {path_url}")
-            return {"url": f"http://fictionsolutions.com{path_url}"}
+        if url:
+            self.logger.debug("Found URL for section '%s': %s", section, url)
+            return {"url": url}
         else:
-            self.logger.warning(f"No URL found for section '{section}'")
+            self.logger.warning("No URL found for section '%s'", section)
 
         return {"url": ""}